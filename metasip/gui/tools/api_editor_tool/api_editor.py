@@ -1017,19 +1017,10 @@ class CodeView(ContainerView):
             return False
 
         # Ignore private items.
-        try:
-            private = (self.api.access == 'private')
-        except AttributeError:
-            private = False
-
-        if private:
+        if getattr(self.api, 'access', '') == 'private':
             return False
 
-        for arg in self.api.args:
-            if arg.unnamed and arg.default != '':
-                return True
-
-        return False
+        return any(arg.unnamed and arg.default != '' for arg in self.api.args)
 
     def draw_status(self):
         """ Update the item's status. """
@@ -41,8 +41,7 @@ def tagged_items(project):
 
     for module in project.modules:
         for sip_file in module.content:
-            for item in _tagged_from_container(sip_file):
-                yield item
+            yield from _tagged_from_container(sip_file)
 
 
 def _tagged_from_container(container):
@@ -54,7 +53,6 @@ def _tagged_from_container(container):
             for enum_value in code.content:
                 yield (enum_value, code)
         elif isinstance(code, CodeContainer):
-            for item in _tagged_from_container(code):
-                yield item
+            yield from _tagged_from_container(code)
 
         yield (code, container)
@@ -86,22 +86,21 @@ class ImportProjectTool(ActionTool):
             if feature in project.features:
                 raise Exception(f"Both '{project_name}' and '{imported_name}' define a '{feature}' feature")
 
+        # The names of the modules of each project so that conflicts can be
+        # checked for without searching the lists of modules each time.
+        module_names = {module.name for module in project.modules}
+        imported_module_names = {module.name for module in imported.modules}
+
         # Merge any externally defined modules.
         for module_name in list(project.externalmodules):
-            for module in imported.modules:
-                if module.name == module_name:
-                    break
-            else:
+            if module_name not in imported_module_names:
                 project.externalmodules.remove(module_name)
 
         for module_name in imported.externalmodules:
             if module_name in project.externalmodules:
                 continue
 
-            for module in project.modules:
-                if module.name == module_name:
-                    break
-            else:
+            if module_name not in module_names:
                 project.externalmodules.append(module_name)
 
         # Merge any platforms.
@@ -111,19 +110,21 @@ class ImportProjectTool(ActionTool):
 
         # Any any new modules and check for conflicts.
         for imported_module in imported.modules:
-            for module in project.modules:
-                if module.name == imported_module.name:
-                    raise Exception(f"Both '{project_name}' and '{imported_name}' define a '{module.name}' module")
+            if imported_module.name in module_names:
+                raise Exception(f"Both '{project_name}' and '{imported_name}' define a '{imported_module.name}' module")
 
             project.modules.append(imported_module)
+            module_names.add(imported_module.name)
 
         # Any any new header directories and check for conflicts.
+        header_names = {header.name for header in project.headers}
+
         for imported_header in imported.headers:
-            for header in project.headers:
-                if header.name == imported_header.name:
-                    raise Exception(f"Both '{project_name}' and '{imported_name}' define a '{header.name}' header directory")
+            if imported_header.name in header_names:
+                raise Exception(f"Both '{project_name}' and '{imported_name}' define a '{imported_header.name}' header directory")
 
-            project.headers.append(imported_headers)
+            project.headers.append(imported_header)
+            header_names.add(imported_header.name)
 
         self.shell.dirty = True
 
@@ -40,39 +40,27 @@ class DeletePlatformDialog(BaseDialog):
         discard = self._discard.isChecked()
 
         # Delete from each API item it appears.
+        inverted_platform = '!' + platform
         remove_items = []
 
         for api_item, container in tagged_items(project):
-            # Ignore items that aren't tagged with a platform.
-            if len(api_item.platforms) == 0:
+            platforms = api_item.platforms
+
+            # Ignore items that aren't tagged with the platform.
+            if platform not in platforms and inverted_platform not in platforms:
+                continue
+
+            # If it is the only platform then the item itself is removed if
+            # we are discarding and it is the platform, or if we are not
+            # discarding and it is the inverted platform.
+            if len(platforms) == 1 and (platforms[0] == platform) == discard:
+                remove_items.append((api_item, container))
                 continue
 
-            remove_platforms = []
-
-            for p in api_item.platforms:
-                if p[0] == '!':
-                    if p[1:] == platform:
-                        # Just remove it if it is not the only one or if we are
-                        # discarding if enabled (and the platform is inverted).
-                        if len(api_item.platforms) > 1 or discard:
-                            remove_platforms.append(f)
-                        else:
-                            remove_items.append((api_item, container))
-                            break
-
-                elif p == platform:
-                    # Just remove it if it is not the only one or if we are
-                    # discarding if enabled.
-                    if len(api_item.platforms) > 1 or not discard:
-                        remove_platforms.append(f)
-                    else:
-                        remove_items.append((api_item, container))
-                        break
-            else:
-                # Note that we deal with a platform appearing multiple times,
-                # even though that is probably a user bug.
-                for p in remove_platforms:
-                    api_item.platforms.remove(p)
+            # Note that we deal with a platform appearing multiple times, even
+            # though that is probably a user bug.
+            platforms[:] = [p for p in platforms
+                    if p != platform and p != inverted_platform]
 
         for api_item, container_item in remove_items:
             container_item.content.remove(api_item)
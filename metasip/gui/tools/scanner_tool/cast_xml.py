@@ -103,9 +103,10 @@ class _ScopedItem(object):
         parser is the parser instance.
         attr is the entity's attribute dictionary.
         """
-        # Not everything has a name (some structs for example).
+        # Not everything has a name (some structs for example).  Names are
+        # interned as they are repeated in the scanned APIs.
         try:
-            self.name = attrs["name"]
+            self.name = sys.intern(attrs["name"])
         except KeyError:
             self.name = None
 
@@ -135,6 +136,9 @@ class _ScopedItem(object):
         except KeyError:
             self.line = None
 
+        # The scoped name is computed when first needed.
+        self._scoped_name = None
+
         parser.scopeditems.append(self)
 
     def asType(self, parser, prefix_ok):
@@ -146,20 +150,26 @@ class _ScopedItem(object):
         """
         assert prefix_ok is None
 
-        sl = []
+        # The scope can't change once the XML has been parsed so the name is
+        # cached.
+        if self._scoped_name is None:
+            sl = []
+
+            if self.name:
+                sl.append(self.name)
 
-        # Prefix it by any scope.
-        if self.name:
-            sl.append(self.name)
+            pc = parser.byid[self.context]
 
-        pc = parser.byid[self.context]
+            # Prefix it by any scope.  Watch for the root namespace which
+            # doesn't have a context.
+            while isinstance(pc, _ScopedItem) and pc.context is not None:
+                sl.append(pc.name)
+                pc = parser.byid[pc.context]
 
-        # Watch for the root namespace which doesn't have a context.
-        while isinstance(pc, _ScopedItem) and pc.context is not None:
-            sl.insert(0, pc.name)
-            pc = parser.byid[pc.context]
+            sl.reverse()
+            self._scoped_name = "::".join(sl)
 
-        return "::".join(sl), True
+        return self._scoped_name, True
 
 
 class _Namespace(_ScopedItem):
@@ -1349,7 +1359,8 @@ class CastXMLParser(ParserBase):
         """
         type_str, _ = self.asInnerType(type_id, None)
 
-        return type_str
+        # The same types are used by many APIs so share them.
+        return sys.intern(type_str)
 
     def asInnerType(self, type_id, prefix_ok):
         """
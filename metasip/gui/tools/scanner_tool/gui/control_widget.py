@@ -3,9 +3,11 @@
 # Copyright (c) 2025 Phil Thompson <phil@riverbankcomputing.com>
 
 
+import fnmatch
 import glob
-import hashlib
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 
 from PyQt6.QtWidgets import (QApplication, QCheckBox, QComboBox, QFileDialog,
         QFormLayout, QGridLayout, QGroupBox, QHBoxLayout, QInputDialog, QLabel,
@@ -23,6 +25,14 @@ from ....helpers import warning
 from ....shell import EventType
 
 
+# The regular expression that matches the comments that are ignored when
+# calculating the signature of a header file.  The closing '/' of a C style
+# comment and the newline ending a C++ style comment are not part of the match.
+# This replicates the character based scanner used by earlier versions so that
+# existing signatures remain valid.
+_comments_re = re.compile(r'/(?=\*)(?:.*?\*(?=/)|.*)|//[^\n]*', re.DOTALL)
+
+
 class ControlWidget(QWidget):
     """ This class is a widget that implements the control part of a scanner's
     GUI.
@@ -37,6 +47,11 @@ class ControlWidget(QWidget):
         self._header_directory = None
         self._header_file = None
 
+        # The signatures of the header files scanned so far keyed by pathname.
+        # Each value is a 2-tuple of the file's modification time and size, and
+        # the signature.
+        self._signatures = {}
+
         layout = QVBoxLayout()
         self.setLayout(layout)
 
@@ -182,6 +197,11 @@ class ControlWidget(QWidget):
     def set_header_file(self, header_file, header_directory, showing_ignored):
         """ Set the current header file. """
 
+        # The check boxes are set to reflect the current state so their
+        # handlers would only repeat the work done here.
+        showing_ignored_blocked = self._showing_ignored.blockSignals(True)
+        ignored_blocked = self._ignored.blockSignals(True)
+
         self._header_file = header_file
         self._header_directory = header_directory
 
@@ -232,6 +252,9 @@ class ControlWidget(QWidget):
         self._configure_parse_button()
         self._update_file_button.setEnabled(enabled)
 
+        self._showing_ignored.blockSignals(showing_ignored_blocked)
+        self._ignored.blockSignals(ignored_blocked)
+
     def set_project(self):
         """ Set the current project. """
 
@@ -368,6 +391,9 @@ class ControlWidget(QWidget):
         # FIXME: Assuming we ultimately want to be able to create a complete
         #        project without parsing .h files then we will need the ability
         #        (in the main editor) to manually create a SipFile instance.
+        working_version = self._working_version.currentText()
+        changed = False
+
         for module in project.modules:
             if module.name == header_file.module:
                 for sip_file in module.content:
@@ -378,41 +404,52 @@ class ControlWidget(QWidget):
                     module.content.append(sip_file)
                     self._tool.shell.notify(EventType.CONTAINER_API_ADD,
                             (module, sip_file))
+                    changed = True
+
+                if self._merge_code(sip_file, parsed_header_file,
+                        working_version):
+                    changed = True
 
-                self._merge_code(sip_file, parsed_header_file)
                 break
 
         # The file version no longer needs parsing.
-        working_version = self._working_version.currentText()
-
         for header_file_version in header_file.versions:
             if header_file_version.version == working_version:
-                header_file_version.parse = False
-                self._tool.header_file_status(header_file)
+                if header_file_version.parse:
+                    header_file_version.parse = False
+                    self._tool.header_file_status(header_file)
+                    changed = True
+
                 break
 
-        self._tool.shell.dirty = True
+        if changed:
+            self._tool.shell.dirty = True
 
     def _handle_reset_workflow(self):
         """ Handle the button to reset the workflow. """
 
         working_version = self._working_version.currentText()
+        changed = False
 
         for header_directory in self._tool.shell.project.headers:
             if working_version == '':
-                header_directory.scan = ['']
+                if header_directory.scan != ['']:
+                    header_directory.scan = ['']
+                    changed = True
             elif working_version not in header_directory.scan:
                 header_directory.scan.append(working_version)
+                changed = True
 
             self._tool.header_directory_status(header_directory)
 
-        self._tool.shell.dirty = True
+        if changed:
+            self._tool.shell.dirty = True
 
     def _handle_scan_header_directory(self):
         """ Handle the button to scan a header directory. """
 
         shell = self._tool.shell
-        project = shell.project
+        log = shell.log
         header_directory = self._header_directory
         platform = header_directory_platform(header_directory)
 
@@ -421,36 +458,48 @@ class ControlWidget(QWidget):
                 platform.inputdirpattern)
 
         header_directory_path = os.path.dirname(source_pattern)
-        shell.log(f"Scanning header directory '{header_directory_path}'")
+        log(f"Scanning header directory '{header_directory_path}'")
+
+        # Save the files that were in the directory keyed by their id().
+        saved = {id(header_file): header_file
+                for header_file in header_directory.content}
+
+        # The files in the directory keyed by their name.
+        header_files = {header_file.name: header_file
+                for header_file in header_directory.content}
 
-        # Save the files that were in the directory.
-        saved = list(header_directory.content)
+        # Calculate the signatures concurrently as this is mostly reading and
+        # hashing, both of which release the GIL.
+        header_paths = list(self._header_paths(source_pattern))
 
-        for header_path in glob.iglob(source_pattern):
-            if not os.path.isfile(header_path):
+        with ThreadPoolExecutor() as executor:
+            signatures = list(executor.map(self._get_signature, header_paths))
+
+        working_version = self._working_version.currentText()
+        changed = False
+
+        for header_path, md5 in zip(header_paths, signatures):
+            if md5 is None:
+                log(f"Skipping unreadable header file '{header_path}'")
                 continue
 
-            if os.access(header_path, os.R_OK):
-                header_file = self._scan_header_file(header_path)
+            header_file, header_file_changed = self._scan_header_file(
+                    header_path, md5, header_files, working_version)
 
-                for saved_header_file in saved:
-                    if saved_header_file is header_file:
-                        saved.remove(saved_header_file)
-                        break
-                else:
-                    # It's a new header file.
-                    header_directory.content.append(header_file)
-                    shell.dirty = True
+            if header_file_changed:
+                changed = True
 
-                shell.log(f"Scanned '{header_path}'")
-            else:
-                shell.log(f"Skipping unreadable header file '{header_path}'")
+            if saved.pop(id(header_file), None) is None:
+                # It's a new header file.
+                header_directory.content.append(header_file)
+                header_files[header_file.name] = header_file
+                changed = True
+
+            log(f"Scanned '{header_path}'")
 
         # Anything left in the saved list has gone missing or was already
         # missing.
-        working_version = self._working_version.currentText()
-
-        for header_file in saved:
+        for header_file in saved.values():
             for header_file_version in header_file.versions:
                 if header_file_version.version == working_version:
                     header_file.versions.remove(header_file_version)
@@ -466,16 +515,19 @@ class ControlWidget(QWidget):
                         # set.
                         pass
 
-                    shell.log(f"'{header_file.name}' is no longer in the header directory")
+                    log(f"'{header_file.name}' is no longer in the header directory")
 
                     self._tool.header_file_removed(header_file)
-                    shell.dirty = True
+                    changed = True
                     break
 
         # This version no longer needs scanning.
         if working_version in header_directory.scan:
             header_directory.scan.remove(working_version)
             self._tool.header_directory_status(header_directory)
+            changed = True
+
+        if changed:
             shell.dirty = True
 
     def _handle_showing_ignored(self, state):
@@ -528,15 +580,44 @@ class ControlWidget(QWidget):
     def _init_version_selector(self):
         """ Initialise the version selector. """
 
+        versions = self._tool.shell.project.versions
+
+        current = [self._working_version.itemText(index)
+                for index in range(self._working_version.count())]
+
+        # Nothing needs doing if the versions haven't changed.
+        if current == versions:
+            return
+
         blocked = self._working_version.blockSignals(True)
-        self._working_version.clear()
-        self._working_version.addItems(self._tool.shell.project.versions)
+
+        # The common case of new versions being appended only needs the new
+        # ones to be added.
+        if versions[:len(current)] != current:
+            self._working_version.clear()
+            current = []
+
+        self._working_version.addItems(versions[len(current):])
         self._working_version.blockSignals(blocked)
 
-    def _merge_code(self, dst_code, src_code):
-        """ Merge source code into destination code. """
+    def _merge_code(self, dst_code, src_code, working_version):
+        """ Merge source code into destination code.  Returns True if the
+        destination code was changed.
+        """
 
-        working_version = self._working_version.currentText()
+        changed = False
+
+        # Group the potentially new code APIs (and their adapters so that they
+        # are created once) by type and name.  APIs can only compare as equal
+        # if these are the same so each existing code API only needs to be
+        # compared against one group.
+        src_groups = {}
+        for src_api in src_code:
+            src_groups.setdefault((type(src_api), src_api.name), []).append(
+                    (src_api, adapt(src_api)))
+
+        # The ids of the potentially new code APIs that already exist.
+        merged = set()
 
         # Go though each existing code API.
         for dst_api in list(dst_code.content):
@@ -544,24 +625,34 @@ class ControlWidget(QWidget):
             if isinstance(dst_api, ManualCode):
                 continue
 
+            dst_adapter = adapt(dst_api)
+            src_group = src_groups.get((type(dst_api), dst_api.name), ())
+
             # Go through each potentially new code API.
-            for src_api in list(src_code):
-                if adapt(dst_api) == adapt(src_api):
+            for src_idx, (src_api, src_adapter) in enumerate(src_group):
+                if dst_adapter == src_adapter:
                     # Make sure the versions include the working version.
                     if working_version != '':
-                        self._add_working_version(dst_api)
+                        if self._add_working_version(dst_api,
+                                working_version):
+                            changed = True
 
                     # Discard the new code API.
-                    src_code.remove(src_api)
+                    del src_group[src_idx]
+                    merged.add(id(src_api))
 
                     # Merge any child code.
                     if isinstance(dst_api, (CodeContainer, Enum)):
-                        self._merge_code(dst_api, src_api.content)
+                        if self._merge_code(dst_api, src_api.content,
+                                working_version):
+                            changed = True
 
                     break
             else:
                 # The existing one doesn't exist in the working version.
                 if working_version == '':
+                    changed = True
+
                     # If it is ignored then forget about it because there are
                     # no other versions that might refer to it.
                     if dst_api.status == 'ignored':
@@ -573,7 +664,11 @@ class ControlWidget(QWidget):
                         dst_api.status = 'removed'
                         self._tool.shell.notify(EventType.API_STATUS, dst_api)
                 else:
-                    version_status = self._remove_working_version(dst_api)
+                    version_status = self._remove_working_version(dst_api,
+                            working_version)
+                    if version_status != 'wasnt_working':
+                        changed = True
+
                     if version_status == 'no_longer_working':
                         # It's removal needs checking.
                         if dst_api.status == '':
@@ -589,6 +684,12 @@ class ControlWidget(QWidget):
                                 (dst_code, dst_api))
 
         # Anything left in the source code is new.
+        src_code = [src_api for src_api in src_code
+                if id(src_api) not in merged]
+
+        # The version range of any new API is only needed if there are any.
+        if len(src_code) == 0:
+            return changed
 
         if working_version == '':
             startversion = endversion = ''
@@ -638,21 +739,36 @@ class ControlWidget(QWidget):
             self._tool.shell.notify(EventType.CONTAINER_API_ADD,
                     (dst_code, src_api))
 
-    def _add_working_version(self, api):
-        """ Add the working version to an API's version ranges. """
+            changed = True
+
+        return changed
+
+    def _add_working_version(self, api, working_version):
+        """ Add the working version to an API's version ranges.  Returns True
+        if the version ranges were changed.
+        """
 
         # There is only something to do if the API is currently versioned.
-        if len(api.versions) != 0:
-            project = self._tool.shell.project
+        if len(api.versions) == 0:
+            return False
+
+        project = self._tool.shell.project
 
-            # Add the working version.
-            vmap = VersionMap(project, api.versions)
-            vmap[self._working_version.currentText()] = True
-            api.versions = vmap.as_version_ranges()
+        # Add the working version.
+        vmap = VersionMap(project, api.versions)
+        vmap[working_version] = True
+        versions = vmap.as_version_ranges()
 
-            self._tool.shell.notify(EventType.API_VERSIONS, api)
+        if versions == api.versions:
+            return False
 
-    def _remove_working_version(self, api):
+        api.versions = versions
+
+        self._tool.shell.notify(EventType.API_VERSIONS, api)
+
+        return True
+
+    def _remove_working_version(self, api, working_version):
         """ Remove the working version from an API's version ranges.  Returns
         'wasnt_working' if the API wasn't in the working version,
         'no_longer_working' if the API is no longer in the working version and
@@ -666,8 +782,6 @@ class ControlWidget(QWidget):
 
         # Update the version map appropriately using the working version.
         # First take a shortcut to see if anything has changed.
-        working_version = self._working_version.currentText()
-
         if not vmap[working_version]:
             return 'wasnt_working'
 
@@ -684,6 +798,34 @@ class ControlWidget(QWidget):
 
         return 'no_longer_working'
 
+    @staticmethod
+    def _header_paths(source_pattern):
+        """ A generator of the pathnames of the files that match a header
+        directory's source pattern.  Only the directory part of the pattern is
+        globbed.  The file name part is compiled once and matched against the
+        entries of each directory.
+        """
+
+        dir_pattern, name_pattern = os.path.split(source_pattern)
+
+        name_re = re.compile(fnmatch.translate(os.path.normcase(name_pattern)))
+
+        # Follow glob's convention for hidden files.
+        match_hidden = name_pattern.startswith('.')
+
+        for dir_path in glob.iglob(dir_pattern):
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        if entry.name.startswith('.') and not match_hidden:
+                            continue
+
+                        if name_re.match(os.path.normcase(entry.name)) and entry.is_file():
+                            yield entry.path
+            except OSError:
+                # The directory doesn't exist or isn't a directory.
+                pass
+
     @classmethod
     def _read_header(cls, name):
         """ Read the contents of a header file.  Handle the special case of the
@@ -737,86 +879,30 @@ class ControlWidget(QWidget):
                                 self._tool.shell.notify(EventType.API_STATUS,
                                         code)
 
-    def _scan_header_file(self, header_path):
-        """ Scan a header file and return the header file instance. """
+    def _scan_header_file(self, header_path, md5, header_files,
+            working_version):
+        """ Scan a header file with a particular signature in the working
+        version and return a 2-tuple of the header file instance and True if
+        the project was changed.  header_files is a dict of the header
+        directory's existing header files keyed by name.
+        """
 
         shell = self._tool.shell
-
-        # Calculate the MD5 signature ignoring any comments.  Note that nested
-        # C style comments aren't handled very well.
-        m = hashlib.md5()
-
-        src, _, encoding = self._read_header(header_path)
-
-        lnr = 1
-        state = 'copy'
-        copy = ''
-        idx = 0
-
-        for ch in src:
-            # Get the previous character.
-            if idx > 0:
-                prev = src[idx - 1]
-            else:
-                prev = ''
-
-            idx += 1
-
-            # Line numbers must be accurate.
-            if ch == '\n':
-                lnr += 1
-
-            # Handle the end of a C style comment.
-            if state == 'ccmnt':
-                if ch == '/' and prev == '*':
-                    state = 'copy'
-
-                continue
-
-            # Handle the end of a C++ style comment.
-            if state == 'cppcmnt':
-                if ch == '\n':
-                    state = 'copy'
-
-                continue
-
-            # We must be in the copy state.
-
-            if ch == '*' and prev == '/':
-                # The start of a C style comment.
-                state = 'ccmnt'
-                continue
-
-            if ch == '/' and prev == '/':
-                # The start of a C++ style comment.
-                state = 'cppcmnt'
-                continue
-
-            # At this point we know the previous character wasn't part of a
-            # comment.
-            if prev:
-                m.update(prev.encode(encoding))
-
-        # Note that we didn't add the last character, but it would normally be
-        # a newline.
-        md5 = m.hexdigest()
+        changed = False
 
         # See if we already know about the file.
         header_directory = self._header_directory
         header_file_name = os.path.basename(header_path)
+        header_file = header_files.get(header_file_name)
 
-        for header_file in header_directory.content:
-            if header_file.name == header_file_name:
-                new_header_file = False
-                break
-        else:
+        if header_file is None:
             # It's a new file.
             header_file = HeaderFile(name=header_file_name)
             new_header_file = True
+        else:
+            new_header_file = False
 
         # See if we already know about this version.
-        working_version = self._working_version.currentText()
-
         for header_file_version in header_file.versions:
             if header_file_version.version == working_version:
                 # See if the version's contents have changed.
@@ -824,7 +910,7 @@ class ControlWidget(QWidget):
                     header_file_version.md5 = md5
                     header_file_version.parse = True
                     self._tool.header_file_status(header_file)
-                    shell.dirty = True
+                    changed = True
 
                 break
         else:
@@ -836,8 +922,10 @@ class ControlWidget(QWidget):
             # Check that the project has versions.
             if len(shell.project.versions) != 0:
                 # Find the immediately preceding version if there is one.
+                version_indices = {v: i
+                        for i, v in enumerate(shell.project.versions)}
                 versions_sorted = sorted(header_file.versions,
-                        key=lambda v: shell.project.versions.index(v.version))
+                        key=lambda v: version_indices[v.version])
 
                 prev_md5 = ''
                 prev_parse = True
@@ -860,9 +948,61 @@ class ControlWidget(QWidget):
             else:
                 self._tool.header_file_status(header_file)
 
-            shell.dirty = True
+            changed = True
+
+        return header_file, changed
+
+    def _get_signature(self, header_path):
+        """ Return the signature of a header file or None if it couldn't be
+        read.  This may be called from a worker thread.
+        """
+
+        try:
+            # Reuse the signature if the file hasn't changed since it was last
+            # scanned.
+            st = os.stat(header_path)
+            header_stat = (st.st_mtime_ns, st.st_size)
+
+            cached_stat, md5 = self._signatures.get(header_path, (None, None))
+
+            if cached_stat != header_stat:
+                md5, actual_path = self._header_signature(header_path)
+
+                # A header that redirects to another one isn't cached as we
+                # don't check if the other one has changed.
+                if actual_path == header_path:
+                    self._signatures[header_path] = (header_stat, md5)
+        except OSError:
+            md5 = None
+
+        return md5
+
+    @classmethod
+    def _header_signature(cls, header_path):
+        """ Return a 2-tuple of the MD5 signature of a header file and the name
+        of the file actually read.
+        """
+
+        import hashlib
+
+        # Calculate the MD5 signature ignoring any comments.  Note that nested
+        # C style comments aren't handled very well.
+        src, actual_path, encoding = cls._read_header(header_path)
+
+        uncommented = []
+        copy_start = 0
+
+        for comment in _comments_re.finditer(src):
+            uncommented.append(src[copy_start:comment.start()])
+            copy_start = comment.end()
+
+        # Note that we don't add the last character, but it would normally be
+        # a newline.
+        uncommented.append(src[copy_start:-1])
+
+        md5 = hashlib.md5(''.join(uncommented).encode(encoding)).hexdigest()
 
-        return header_file
+        return md5, actual_path
 
     def _set_module_selector(self, ignored):
         """ Set the module selector for a header file. """
@@ -22,6 +22,10 @@ class SourcesWidget(QTreeWidget):
 
         self._tool = tool
 
+        # The header file items keyed by the id() of the header file.  This is
+        # populated on demand.
+        self._header_file_item_map = {}
+
         self.setHeaderLabels(("Name", "Status"))
 
         self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
@@ -54,12 +58,17 @@ class SourcesWidget(QTreeWidget):
                 header_directory_item)
         self.takeTopLevelItem(header_directory_index)
 
+        for header_file_item in self._header_file_items(header_directory_item):
+            self._header_file_item_map.pop(
+                    id(header_file_item.project_item), None)
+
     def header_file_added(self, header_file, header_directory, working_version):
         """ A header file has been added. """
 
         header_directory_item = self._find_header_directory_item(
                 header_directory)
         header_file_item = _HeaderFileItem(header_file, header_directory_item)
+        self._header_file_item_map[id(header_file)] = header_file_item
         header_file_item.set_working_version(working_version)
         header_directory_item.sort_header_files()
 
@@ -79,7 +88,8 @@ class SourcesWidget(QTreeWidget):
             header_directory_item = header_file_item.parent()
             header_file_index = header_directory_item.indexOfChild(
                     header_file_item)
-            header_directory_item.takeChild(header_item_index)
+            header_directory_item.takeChild(header_file_index)
+            del self._header_file_item_map[id(header_file)]
         else:
             # The header file still exists in other versions.
             header_file_item.setHidden(True)
@@ -112,6 +122,7 @@ class SourcesWidget(QTreeWidget):
         """ Set the current project. """
 
         self.clear()
+        self._header_file_item_map.clear()
 
         for header_directory in self._tool.shell.project.headers:
             _HeaderDirectoryItem(header_directory, self)
@@ -140,13 +151,18 @@ class SourcesWidget(QTreeWidget):
     def _find_header_file_item(self, header_file):
         """ Return the header file item for a header file. """
 
-        for header_directory_item in self._header_directory_items():
-            for header_file_item in self._header_file_items(header_directory_item):
-                if header_file_item.project_item is header_file:
-                    return header_file_item
+        header_file_item = self._header_file_item_map.get(id(header_file))
 
-        # This should never happen.
-        return None
+        if header_file_item is None:
+            # Refresh the map with all the current items.
+            for header_directory_item in self._header_directory_items():
+                for item in self._header_file_items(header_directory_item):
+                    self._header_file_item_map[id(item.project_item)] = item
+
+            # This should never return None.
+            header_file_item = self._header_file_item_map.get(id(header_file))
+
+        return header_file_item
 
     def _handle_selection_change(self, current, previous):
         """ Invoked when the item selection changes. """
@@ -21,6 +21,10 @@ class ParserBase(ContentHandler):
 
         self.diagnostic = None
 
+        # The element handlers are looked up once and cached.
+        self._class_map = None
+        self._methods = {}
+
         self._parser = make_parser()
         self._parser.setContentHandler(self)
 
@@ -36,16 +40,23 @@ class ParserBase(ContentHandler):
 
         name is the name.
         """
-        return self.classMap().get(name)
+        class_map = self._class_map
+
+        if class_map is None:
+            class_map = self._class_map = self.classMap()
+
+        return class_map.get(name)
 
     def _findMethod(self, name):
         """
-        Return the bound method with the given name.
+        Return the unbound method with the given name, or None if none.
         """
         try:
-            m = getattr(self, name)
-        except AttributeError:
-            m = None
+            return self._methods[name]
+        except KeyError:
+            pass
+
+        m = self._methods[name] = getattr(type(self), name, None)
 
         return m
 
@@ -66,7 +77,7 @@ class ParserBase(ContentHandler):
             m = self._findMethod(name + "Start")
 
             if m:
-                m(attrs)
+                m(self, attrs)
 
     def endElement(self, name):
         """
@@ -82,7 +93,7 @@ class ParserBase(ContentHandler):
         m = self._findMethod(name + "End")
 
         if m:
-            m()
+            m(self)
 
     def parse(self, ifname):
         """ Parse an XML file.
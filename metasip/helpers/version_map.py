@@ -3,6 +3,8 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
+from functools import lru_cache
+
 from ..models import VersionRange
 
 
@@ -15,6 +17,7 @@ class VersionMap:
         """ Return a version map with each entry set to an initial value. """
 
         self._versions = project.versions
+        self._indices = _version_indices(tuple(self._versions))
         self._initialise_map(False)
 
         if version_ranges is not None:
@@ -28,12 +31,12 @@ class VersionMap:
     def __getitem__(self, version):
         """ Return the map value for a version. """
 
-        return self._map[self._versions.index(version)]
+        return self._map[self._indices[version]]
 
     def __setitem__(self, version, value):
         """ Set the map value for a version. """
 
-        self._map[self._versions.index(version)] = value
+        self._map[self._indices[version]] = value
 
     def update_from_version_ranges(self, version_ranges):
         """ Update the version map from a list of version ranges. """
@@ -47,12 +50,12 @@ class VersionMap:
             if version_range.startversion == '':
                 start_idx = 0
             else:
-                start_idx = self._versions.index(version_range.startversion)
+                start_idx = self._indices[version_range.startversion]
 
             if version_range.endversion == '':
                 end_idx = len(self._versions)
             else:
-                end_idx = self._versions.index(version_range.endversion)
+                end_idx = self._indices[version_range.endversion]
 
             for i in range(start_idx, end_idx):
                 self._map[i] = True
@@ -100,3 +103,13 @@ class VersionMap:
         """ Initialise the map. """
 
         self._map = [initial_state for v in self._versions]
+
+
+@lru_cache(maxsize=8)
+def _version_indices(versions):
+    """ Return a dict mapping each of a tuple of versions to its index.  A
+    version map is created for every API that is merged so the (read-only)
+    result is cached rather than rebuilt each time.
+    """
+
+    return {v: i for i, v in enumerate(versions)}
@@ -3,17 +3,31 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
+from functools import lru_cache
+
+
 def version_range(version_range):
     """ Return a version range as a string. """
 
-    if version_range.startversion == '':
-        if version_range.endversion == '':
+    return _version_range_str(version_range.startversion,
+            version_range.endversion)
+
+
+@lru_cache(maxsize=None)
+def _version_range_str(startversion, endversion):
+    """ Return a version range, specified as its start and end versions, as a
+    string.  The same few ranges are used by many APIs so the results are
+    cached.
+    """
+
+    if startversion == '':
+        if endversion == '':
             # This should never happen.
             return ''
 
-        return '- ' + version_range.endversion
+        return '- ' + endversion
 
-    if version_range.endversion == '':
-        return version_range.startversion + ' -'
+    if endversion == '':
+        return startversion + ' -'
 
-    return version_range.startversion + ' - ' + version_range.endversion
+    return startversion + ' - ' + endversion
@@ -48,7 +48,7 @@ def _generate(project_name, output_dir, ignore, verbose):
         raise UserException("Specify the name of an existing project file")
 
     project = Project(project_name)
-    load_project(project)
+    load_project(project, ignored_modules=ignore)
 
     generate_sip_files(project, output_dir, ignore, verbose)
 
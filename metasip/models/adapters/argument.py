@@ -46,15 +46,13 @@ class ArgumentAdapter(BaseApiAdapter):
 
         s = self.expand_type(arg.pytype if arg.pytype != '' else arg.type,
                 name=arg.name)
+        annos = adapt(arg, Annos).as_str()
+        default = arg.pydefault if arg.pydefault != '' else arg.default
 
-        s += adapt(arg, Annos).as_str()
+        if default != '':
+            return f'{s}{annos} = {default}'
 
-        if arg.pydefault != '':
-            s += ' = ' + arg.pydefault
-        elif arg.default != '':
-            s += ' = ' + arg.default
-
-        return s
+        return s + annos
 
     def as_str(self):
         """ Return the standard string representation. """
@@ -64,7 +62,7 @@ class ArgumentAdapter(BaseApiAdapter):
         s = self.expand_type(arg.type, name=arg.name)
 
         if arg.default != '':
-            s += ' = ' + arg.default
+            return f'{s} = {arg.default}'
 
         return s
 
@@ -5,13 +5,25 @@
 
 from abc import ABC, abstractmethod
 from enum import auto, Enum
-from xml.sax.saxutils import escape
+from functools import lru_cache
+import re
+from sys import intern
 
 from ...helpers import version_range
 
+from ..version_range import VersionRange
+
 from .adapt import adapt
 
 
+# The translation table used to escape XML attributes and text.
+_XML_ESCAPE_TABLE = str.maketrans(
+        {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+# The regular expression that finds the delimiters of template arguments.
+_TEMPLATE_DELIMITERS_RE = re.compile(r'[<>,]')
+
+
 class AttributeType(Enum):
     """ The different types of element and model attributes. """
 
@@ -30,11 +42,28 @@ class BaseAdapter(ABC):
     # The default attribute type map.
     ATTRIBUTE_TYPE_MAP = {}
 
+    # The names of the BOOL, LITERAL, STRING and STRING_LIST attributes in
+    # ATTRIBUTE_TYPE_MAP.  This is set for each sub-class when it is defined.
+    _ATTRIBUTES_BY_TYPE = ((), (), (), ())
+
     def __init__(self, model):
         """ Initialise the adapter. """
 
         self.model = model
 
+    def __init_subclass__(cls, **kwargs):
+        """ Initialise a sub-class. """
+
+        super().__init_subclass__(**kwargs)
+
+        cls._ATTRIBUTES_BY_TYPE = tuple(
+                tuple(name
+                        for name, attribute_type in cls.ATTRIBUTE_TYPE_MAP.items()
+                        if attribute_type is required_type)
+                for required_type in (AttributeType.BOOL,
+                        AttributeType.LITERAL, AttributeType.STRING,
+                        AttributeType.STRING_LIST))
+
     def __eq__(self, other):
         """ Compare for C/C++ equality. """
 
@@ -62,11 +91,7 @@ class BaseAdapter(ABC):
         if type == '':
             return ''
 
-        # This is entirely cosmetic to be consistent with older versions.
-        type = cls._normalise_templates(type)
-
-        # SIP can't yet handle every C++ fundamental type.
-        s = type.replace('long int', 'long')
+        s = cls._normalise_type(type)
 
         # If there is no embedded %s then just append the name.
         if '%s' in s:
@@ -92,22 +117,33 @@ class BaseAdapter(ABC):
 
         # This default implementation loads attributes define by
         # ATTRIBUTE_TYPE_MAP.
-        for name, attribute_type in self.ATTRIBUTE_TYPE_MAP.items():
-            if attribute_type is AttributeType.BOOL:
-                value = bool(int(element.get(name, '0')))
-            elif attribute_type is AttributeType.LITERAL:
-                for subelement in element:
-                    if subelement.tag == 'Literal' and subelement.get('type') == name:
-                        value = subelement.text.strip()
-                        break
-                else:
-                    value = ''
-            elif attribute_type is AttributeType.STRING:
-                value = element.get(name, '')
-            elif attribute_type is AttributeType.STRING_LIST:
-                value = element.get(name, '').split()
+        model = self.model
+        bools, literals, strings, string_lists = self._ATTRIBUTES_BY_TYPE
+
+        # Note that bools are only ever saved with a value of '1'.
+        for name in bools:
+            setattr(model, name, element.get(name) == '1')
+
+        if literals:
+            # Find all the literals with one pass of the subelements.
+            texts = {}
 
-            setattr(self.model, name, value)
+            for subelement in element:
+                if subelement.tag == 'Literal':
+                    texts.setdefault(subelement.get('type'), subelement.text)
+
+            for name in literals:
+                text = texts.get(name)
+                setattr(model, name, '' if text is None else text.strip())
+
+        # Values such as status, access, names and types are repeated many
+        # times in a project so share a single copy.
+        for name in strings:
+            setattr(model, name, intern(element.get(name, '')))
+
+        for name in string_lists:
+            setattr(model, name,
+                    [intern(v) for v in element.get(name, '').split()])
 
     def save(self, output):
         """ Save the model to an output file. """
@@ -134,10 +170,19 @@ class BaseAdapter(ABC):
     def save_bool(self, name, output):
         """ Save a bool. """
 
-        value = getattr(self.model, name)
+        if getattr(self.model, name):
+            # There is no need to escape anything.
+            output.write(f' {name}="1"')
 
-        if value:
-            self.save_attribute(name, '1', output)
+    def save_bools(self, names, output):
+        """ Save a sequence of bools with a single write. """
+
+        model = self.model
+        attrs = ''.join(f' {name}="1"' for name in names
+                if getattr(model, name))
+
+        if attrs:
+            output.write(attrs)
 
     def save_literal(self, name, output):
         """ Save the value of a literal text attribute. """
@@ -147,6 +192,24 @@ class BaseAdapter(ABC):
         if value != '':
             output.write(f'<Literal type="{name}">\n{self._escape(value)}\n</Literal>\n', indent=False)
 
+    def save_literals(self, names, output):
+        """ Save the values of a sequence of literal text attributes with a
+        single write.
+        """
+
+        model = self.model
+        parts = []
+
+        for name in names:
+            value = getattr(model, name)
+
+            if value != '':
+                parts.append(
+                        f'<Literal type="{name}">\n{self._escape(value)}\n</Literal>\n')
+
+        if parts:
+            output.write(''.join(parts), indent=False)
+
     def save_str(self, name, output):
         """ Save a string. """
 
@@ -175,7 +238,25 @@ class BaseAdapter(ABC):
     def _escape(s):
         """ Return an XML escaped string. """
 
-        return escape(s, {'"': '&quot;'})
+        # Most values (eg. names) don't need escaping and testing for the
+        # special characters is much faster than translating.
+        if '&' in s or '<' in s or '>' in s or '"' in s:
+            return s.translate(_XML_ESCAPE_TABLE)
+
+        return s
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _normalise_type(type):
+        """ Return the normalised form of a type.  The same types are used
+        many times in a project so the results are cached.
+        """
+
+        # This is entirely cosmetic to be consistent with older versions.
+        type = BaseAdapter._normalise_templates(type)
+
+        # SIP can't yet handle every C++ fundamental type.
+        return type.replace('long int', 'long')
 
     @classmethod
     def _normalise_templates(cls, type):
@@ -187,9 +268,25 @@ class BaseAdapter(ABC):
         if t_start > 0 and t_end > t_start:
             xt = []
 
-            # Note that this doesn't handle nested template arguments properly.
-            for t_arg in type[t_start + 1:t_end].split(','):
-                xt.append(cls._normalise_templates(t_arg.strip()))
+            # Split the template arguments at the top level commas only so
+            # that nested template arguments are handled properly.
+            depth = 0
+            a_start = t_start + 1
+
+            for m in _TEMPLATE_DELIMITERS_RE.finditer(type, a_start, t_end):
+                delim = m.group()
+
+                if delim == '<':
+                    depth += 1
+                elif delim == '>':
+                    depth -= 1
+                elif depth == 0:
+                    xt.append(
+                            cls._normalise_templates(
+                                    type[a_start:m.start()].strip()))
+                    a_start = m.end()
+
+            xt.append(cls._normalise_templates(type[a_start:t_end].strip()))
 
             type = type[:t_start + 1] + ', '.join(xt) + type[t_end:]
 
@@ -215,26 +312,22 @@ class BaseApiAdapter(BaseAdapter):
 
         api = self.model
 
-        nr_ends = 0
-
-        for vrange in api.versions:
-            vr = version_range(vrange)
-            output.write(f'%If ({vr})\n', indent=False)
-            nr_ends += 1
+        # Most APIs have no guards.
+        if api.versions or api.platforms or api.features:
+            versions = tuple((vrange.startversion, vrange.endversion)
+                    for vrange in api.versions)
 
-        # Multiple platforms are logically or-ed.
-        if len(api.platforms) != 0:
-            platforms = ' || '.join(api.platforms)
-            output.write(f'%If ({platforms})\n', indent=False)
-            nr_ends += 1
+            guards, nr_ends = self._version_guards(versions,
+                    tuple(api.platforms), tuple(api.features))
 
-        # Multiple features are nested (ie. logically and-ed).
-        for feature in api.features:
-            output.write(f'%If ({feature})\n', indent=False)
-            nr_ends += 1
+            output.write(guards, indent=False)
+        else:
+            nr_ends = 0
 
         # Also handle comments.
         if api.comments != '':
+            lines = []
+
             for line in api.comments.split('\n'):
                 line = line.rstrip()
                 if line != '':
@@ -242,7 +335,9 @@ class BaseApiAdapter(BaseAdapter):
                 else:
                     line = '//\n'
 
-                output.write(line)
+                lines.append(line)
+
+            output.write(''.join(lines))
 
         return nr_ends
 
@@ -250,5 +345,33 @@ class BaseApiAdapter(BaseAdapter):
     def version_end(nr_ends, output):
         """ Write the end of the version tests for an API item. """
 
-        for _ in range(nr_ends):
-            output.write('%End\n', indent=False)
+        output.write('%End\n' * nr_ends, indent=False)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _version_guards(versions, platforms, features):
+        """ Return a 2-tuple of the %If directives for a combination of
+        versions, platforms and features and the number of them.  Only a
+        small number of combinations are used in a project so the results are
+        cached.
+        """
+
+        # Each guard is a separate %If so that they are nested (ie. logically
+        # and-ed).
+        guards = []
+
+        for startversion, endversion in versions:
+            vrange = version_range(
+                    VersionRange(startversion=startversion,
+                            endversion=endversion))
+            guards.append(f'%If ({vrange})\n')
+
+        # Multiple platforms are logically or-ed.
+        if len(platforms) != 0:
+            platforms = ' || '.join(platforms)
+            guards.append(f'%If ({platforms})\n')
+
+        # Multiple features are nested (ie. logically and-ed).
+        guards.extend([f'%If ({feature})\n' for feature in features])
+
+        return ''.join(guards), len(guards)
@@ -34,10 +34,10 @@ class CallableAdapter(BaseAdapter):
         if callable.name != other_callable.name:
             return False
 
-        if self.expand_type(callable.rtype) != self.expand_type(other_callable.rtype):
+        if len(callable.args) != len(other_callable.args):
             return False
 
-        if len(callable.args) != len(other_callable.args):
+        if self.expand_type(callable.rtype) != self.expand_type(other_callable.rtype):
             return False
 
         for arg, other_arg in zip(callable.args, other_callable.args):
@@ -52,14 +52,7 @@ class CallableAdapter(BaseAdapter):
         callable = self.model
 
         # This is the Python signature.
-        s = self.return_type_as_str(allow_py=True) + callable.name
-
-        if callable.pyargs != '':
-            s += callable.pyargs
-        else:
-            args = ', '.join([adapt(arg).as_py_str() for arg in callable.args])
-            s += '(' + args + ')'
-
+        s = self.return_type_as_str(allow_py=True) + callable.name + self.py_args_as_str()
         s += adapt(callable, Annos).as_str()
 
         # We include a separate C++ signature if it is different to the Python
@@ -70,11 +63,20 @@ class CallableAdapter(BaseAdapter):
             if return_type != '':
                 return_type += ' '
 
-            args = ', '.join([adapt(arg).as_str() for arg in callable.args])
-            s += f' [{return_type}({args})]'
+            s += f' [{return_type}({self.args_as_str()})]'
 
         return s
 
+    def args_as_str(self):
+        """ Return the C/C++ arguments as a string. """
+
+        args = self.model.args
+
+        if not args:
+            return ''
+
+        return ', '.join([adapt(arg).as_str() for arg in args])
+
     def has_different_signatures(self):
         """ Returns True if the Python and C/C++ signatures are different. """
 
@@ -109,6 +111,21 @@ class CallableAdapter(BaseAdapter):
                 adapt(arg).load(subelement, project, ui)
                 self.model.args.append(arg)
 
+    def py_args_as_str(self):
+        """ Return the Python arguments, including the parentheses, as a
+        string.
+        """
+
+        callable = self.model
+
+        if callable.pyargs != '':
+            return callable.pyargs
+
+        if not callable.args:
+            return '()'
+
+        return '(' + ', '.join([adapt(arg).as_py_str() for arg in callable.args]) + ')'
+
     def return_type_as_str(self, allow_py=False):
         """ Return the return type as a string. """
 
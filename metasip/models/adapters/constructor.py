@@ -58,8 +58,7 @@ class ConstructorAdapter(BaseApiAdapter):
 
         nr_ends = self.version_start(output)
 
-        output.write(self.as_str())
-        output.write(';\n')
+        output.write(self.as_str() + ';\n')
 
         adapt(ctor, Docstring).generate_sip_directives(output)
         adapt(ctor, Callable).generate_sip_directives(output)
@@ -61,8 +61,7 @@ class DestructorAdapter(BaseApiAdapter):
 
         nr_ends = self.version_start(output)
 
-        output.write(self.as_str())
-        output.write(';\n')
+        output.write(self.as_str() + ';\n')
 
         output.write_code_directive('%MethodCode', dtor.methcode)
         output.write_code_directive('%VirtualCatcherCode', dtor.virtcode)
@@ -92,8 +91,7 @@ class DestructorAdapter(BaseApiAdapter):
         output.write('>\n')
 
         output += 1
-        self.save_literal('methcode', output)
-        self.save_literal('virtcode', output)
+        self.save_literals(('methcode', 'virtcode'), output)
         adapt(dtor, Code).save_subelements(output)
         adapt(dtor, Access).save_subelements(output)
         output -= 1
@@ -66,8 +66,7 @@ class EnumAdapter(BaseApiAdapter):
         nr_ends = self.version_start(output)
 
         output.blank()
-        output.write(self.as_str())
-        output.write('\n{\n')
+        output.write(self.as_str() + '\n{\n')
         output += 1
 
         for enum_value in enum.content:
@@ -43,20 +43,14 @@ class FunctionAdapter(BaseApiAdapter):
         # Note that we don't use CallableAdapter's implementation because we
         # dont want any C/C++ signature.
 
-        s = adapt(function, Callable).return_type_as_str(allow_py=True) + function.name
-
-        if function.pyargs != '':
-            s += function.pyargs
-        else:
-            args = ', '.join([adapt(arg).as_py_str() for arg in function.args])
-            s += '(' + args + ')'
+        callable_adapter = adapt(function, Callable)
 
+        s = callable_adapter.return_type_as_str(allow_py=True) + function.name + callable_adapter.py_args_as_str()
         s += adapt(function, Annos).as_str()
-        output.write(s)
-        output.write(';\n')
+        output.write(s + ';\n')
 
         adapt(function, Docstring).generate_sip_directives(output)
-        adapt(function, Callable).generate_sip_directives(output)
+        callable_adapter.generate_sip_directives(output)
 
         self.version_end(nr_ends, output)
 
@@ -21,6 +21,7 @@ class HeaderFileVersionAdapter(BaseAdapter):
 
         header_file_version = self.model
 
-        output.write(f'<HeaderFileVersion md5="{header_file_version.md5}" version="{header_file_version.version}"')
-        self.save_bool('parse', output)
-        output.write('/>\n')
+        # There are many of these so write each one with a single call.
+        parse = ' parse="1"' if header_file_version.parse else ''
+
+        output.write(f'<HeaderFileVersion md5="{header_file_version.md5}" version="{header_file_version.version}"{parse}/>\n')
@@ -69,6 +69,27 @@ class ClassAdapter(BaseApiAdapter):
         'Variable':         Variable,
     }
 
+    # The literal attributes in the order they are saved (to match older
+    # versions).
+    _SAVED_LITERALS = (
+        'typehintcode',
+        'typeheadercode',
+        'typecode',
+        'finalisationcode',
+        'subclasscode',
+        'convtotypecode',
+        'convfromtypecode',
+        'gctraversecode',
+        'gcclearcode',
+        'bigetbufcode',
+        'birelbufcode',
+        'bireadbufcode',
+        'biwritebufcode',
+        'bisegcountcode',
+        'bicharbufcode',
+        'picklecode',
+    )
+
     def __eq__(self, other):
         """ Compare for C/C++ equality. """
 
@@ -238,22 +259,7 @@ class ClassAdapter(BaseApiAdapter):
         # The order is to match older versions.
         adapt(klass, Code).save_subelements(output)
         adapt(klass, Docstring).save_subelements(output)
-        self.save_literal('typehintcode', output)
-        self.save_literal('typeheadercode', output)
-        self.save_literal('typecode', output)
-        self.save_literal('finalisationcode', output)
-        self.save_literal('subclasscode', output)
-        self.save_literal('convtotypecode', output)
-        self.save_literal('convfromtypecode', output)
-        self.save_literal('gctraversecode', output)
-        self.save_literal('gcclearcode', output)
-        self.save_literal('bigetbufcode', output)
-        self.save_literal('birelbufcode', output)
-        self.save_literal('bireadbufcode', output)
-        self.save_literal('biwritebufcode', output)
-        self.save_literal('bisegcountcode', output)
-        self.save_literal('bicharbufcode', output)
-        self.save_literal('picklecode', output)
+        self.save_literals(self._SAVED_LITERALS, output)
         adapt(klass, CodeContainer).save_subelements(output)
         adapt(klass, Access).save_subelements(output)
         output -= 1
@@ -73,39 +73,35 @@ class MethodAdapter(BaseApiAdapter):
 
         callable_adapter = adapt(method, Callable)
 
-        s = ''
+        parts = []
 
         if method.virtual:
-            s += 'virtual '
+            parts.append('virtual ')
 
         if method.static:
-            s += 'static '
+            parts.append('static ')
 
-        s += callable_adapter.return_type_as_str(allow_py=True) + method.name
-
-        if method.pyargs != '':
-            s += method.pyargs
-        else:
-            args = ', '.join([adapt(arg).as_py_str() for arg in method.args])
-            s += '(' + args + ')'
+        parts.append(callable_adapter.return_type_as_str(allow_py=True))
+        parts.append(method.name)
+        parts.append(callable_adapter.py_args_as_str())
 
         if method.const:
-            s += ' const'
+            parts.append(' const')
 
         if method.final:
-            s += ' final'
+            parts.append(' final')
 
         if method.abstract:
-            s += ' = 0'
+            parts.append(' = 0')
 
-        s += adapt(method, Annos).as_str()
+        parts.append(adapt(method, Annos).as_str())
 
         if (method.virtual or method.access.startswith('protected') or method.methcode == '') and callable_adapter.has_different_signatures():
             return_type = callable_adapter.return_type_as_str().strip()
-            args = ', '.join([adapt(arg).as_str() for arg in method.args])
-            s += f' [{return_type} ({args})]'
+            parts.append(
+                    f' [{return_type} ({callable_adapter.args_as_str()})]')
 
-        return s
+        return ''.join(parts)
 
     def generate_sip(self, sip_file, output):
         """ Generate the .sip file content. """
@@ -114,8 +110,7 @@ class MethodAdapter(BaseApiAdapter):
 
         nr_ends = self.version_start(output)
 
-        output.write(self.as_str())
-        output.write(';\n')
+        output.write(self.as_str() + ';\n')
 
         adapt(method, Docstring).generate_sip_directives(output)
         adapt(method, Callable).generate_sip_directives(output)
@@ -144,11 +139,8 @@ class MethodAdapter(BaseApiAdapter):
         adapt(method, Callable).save_attributes(output)
         adapt(method, Docstring).save_attributes(output)
         adapt(method, ExtendedAccess).save_attributes(output)
-        self.save_bool('virtual', output)
-        self.save_bool('const', output)
-        self.save_bool('final', output)
-        self.save_bool('static', output)
-        self.save_bool('abstract', output)
+        self.save_bools(('virtual', 'const', 'final', 'static', 'abstract'),
+                output)
         output.write('>\n')
 
         output += 1
@@ -70,8 +70,7 @@ class ModuleAdapter(BaseAdapter):
 
         self.save_str('keywordarguments', output)
         self.save_str('virtualerrorhandler', output)
-        self.save_bool('uselimitedapi', output)
-        self.save_bool('pyssizetclean', output)
+        self.save_bools(('uselimitedapi', 'pyssizetclean'), output)
         self.save_str_list('imports', output)
         output.write('>\n')
         output += 1
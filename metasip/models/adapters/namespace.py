@@ -71,8 +71,7 @@ class NamespaceAdapter(BaseApiAdapter):
 
         output.blank()
 
-        output.write(self.as_str())
-        output.write('\n{\n')
+        output.write(self.as_str() + '\n{\n')
 
         output.write('%TypeHeaderCode\n', indent=False)
 
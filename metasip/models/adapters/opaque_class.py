@@ -48,8 +48,7 @@ class OpaqueClassAdapter(BaseApiAdapter):
 
         nr_ends = self.version_start(output)
 
-        output.write(self.as_str())
-        output.write(';\n')
+        output.write(self.as_str() + ';\n')
 
         self.version_end(nr_ends, output)
 
@@ -54,8 +54,7 @@ class OperatorCastAdapter(BaseApiAdapter):
 
         nr_ends = self.version_start(output)
 
-        output.write(self.as_str())
-        output.write(';\n')
+        output.write(self.as_str() + ';\n')
 
         adapt(cast, Callable).generate_sip_directives(output)
         adapt(cast, Access).generate_sip_directives(output)
@@ -36,18 +36,13 @@ class OperatorFunctionAdapter(BaseApiAdapter):
 
         s = callable_adapter.return_type_as_str(allow_py=True) + 'operator' + function.name
 
-        if function.pyargs != '':
-            s += function.pyargs
-        else:
-            args = ', '.join([adapt(arg).as_py_str() for arg in function.args])
-            s += '(' + args + ')'
+        s += callable_adapter.py_args_as_str()
 
         s += adapt(function, Annos).as_str()
 
         if callable_adapter.has_different_signatures():
             return_type = callable_adapter.return_type_as_str().strip()
-            args = ', '.join([adapt(arg).as_str() for arg in function.args])
-            s += f' [{return_type} ({args})]'
+            s += f' [{return_type} ({callable_adapter.args_as_str()})]'
 
         return s
 
@@ -58,8 +53,7 @@ class OperatorFunctionAdapter(BaseApiAdapter):
 
         nr_ends = self.version_start(output)
 
-        output.write(self.as_str())
-        output.write(';\n')
+        output.write(self.as_str() + ';\n')
         adapt(function, Callable).generate_sip_directives(output)
 
         self.version_end(nr_ends, output)
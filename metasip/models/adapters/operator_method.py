@@ -58,33 +58,30 @@ class OperatorMethodAdapter(BaseApiAdapter):
 
         callable_adapter = adapt(method, Callable)
 
-        s = ''
+        parts = []
 
         if method.virtual:
-            s += 'virtual '
+            parts.append('virtual ')
 
-        s += callable_adapter.return_type_as_str(allow_py=True) + 'operator' + method.name
-
-        if method.pyargs != '':
-            s += method.pyargs
-        else:
-            args = ', '.join([adapt(arg).as_py_str() for arg in method.args])
-            s += '(' + args + ')'
+        parts.append(callable_adapter.return_type_as_str(allow_py=True))
+        parts.append('operator')
+        parts.append(method.name)
+        parts.append(callable_adapter.py_args_as_str())
 
         if method.const:
-            s += ' const'
+            parts.append(' const')
 
         if method.abstract:
-            s += ' = 0'
+            parts.append(' = 0')
 
-        s += adapt(method, Annos).as_str()
+        parts.append(adapt(method, Annos).as_str())
 
         if (method.virtual or method.access.startswith('protected') or method.methcode == '') and callable_adapter.has_different_signatures():
             return_type = callable_adapter.return_type_as_str().strip()
-            args = ', '.join([adapt(arg).as_str() for arg in method.args])
-            s += f' [{return_type} ({args})]'
+            parts.append(
+                    f' [{return_type} ({callable_adapter.args_as_str()})]')
 
-        return s
+        return ''.join(parts)
 
     def generate_sip(self, sip_file, output):
         """ Generate the .sip file content. """
@@ -93,8 +90,7 @@ class OperatorMethodAdapter(BaseApiAdapter):
 
         nr_ends = self.version_start(output)
 
-        output.write(self.as_str())
-        output.write(';\n')
+        output.write(self.as_str() + ';\n')
 
         adapt(method, Callable).generate_sip_directives(output)
         adapt(method, Access).generate_sip_directives(output)
@@ -120,9 +116,7 @@ class OperatorMethodAdapter(BaseApiAdapter):
         output.write('<OperatorMethod')
         adapt(method, Callable).save_attributes(output)
         adapt(method, Access).save_attributes(output)
-        self.save_bool('virtual', output)
-        self.save_bool('const', output)
-        self.save_bool('abstract', output)
+        self.save_bools(('virtual', 'const', 'abstract'), output)
         output.write('>\n')
 
         output += 1
@@ -47,6 +47,18 @@ class SipFileAdapter(BaseAdapter):
         'Variable':         Variable,
     }
 
+    # The literal attributes in the order they are saved.
+    _SAVED_LITERALS = (
+        'exportedheadercode',
+        'moduleheadercode',
+        'modulecode',
+        'preinitcode',
+        'initcode',
+        'postinitcode',
+        'exportedtypehintcode',
+        'typehintcode',
+    )
+
     def as_str(self):
         """ Return the standard string representation. """
 
@@ -77,14 +89,7 @@ class SipFileAdapter(BaseAdapter):
 
         output += 1
         adapt(sip_file, CodeContainer).save_subelements(output)
-        self.save_literal('exportedheadercode', output)
-        self.save_literal('moduleheadercode', output)
-        self.save_literal('modulecode', output)
-        self.save_literal('preinitcode', output)
-        self.save_literal('initcode', output)
-        self.save_literal('postinitcode', output)
-        self.save_literal('exportedtypehintcode', output)
-        self.save_literal('typehintcode', output)
+        self.save_literals(self._SAVED_LITERALS, output)
         output -= 1
 
         output.write('</SipFile>\n')
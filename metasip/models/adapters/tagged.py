@@ -3,6 +3,8 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
+from sys import intern
+
 from ...helpers import version_range
 
 from ..version_range import VersionRange
@@ -31,8 +33,10 @@ class TaggedAdapter(BaseAdapter):
 
         if versions is not None:
             for version in versions.split():
+                startversion, endversion = version.split('-')
                 version_range = VersionRange()
-                version_range.startversion, version_range.endversion = version.split('-')
+                version_range.startversion = intern(startversion)
+                version_range.endversion = intern(endversion)
                 self.model.versions.append(version_range)
 
     def save_attributes(self, output):
@@ -51,8 +51,7 @@ class TypedefAdapter(BaseApiAdapter):
 
         nr_ends = self.version_start(output)
 
-        output.write(self.as_str())
-        output.write(';\n')
+        output.write(self.as_str() + ';\n')
 
         adapt(typedef, Docstring).generate_sip_directives(output)
 
@@ -76,8 +75,8 @@ class TypedefAdapter(BaseApiAdapter):
         output.write('<Typedef')
         adapt(typedef, Code).save_attributes(output)
         adapt(typedef, Docstring).save_attributes(output)
-        self.save_attribute('name', typedef.name, output)
-        self.save_attribute('type', typedef.type, output)
+        output.write(
+                f' name="{self._escape(typedef.name)}" type="{self._escape(typedef.type)}"')
         output.write('>\n')
 
         output += 1
@@ -66,21 +66,18 @@ class VariableAdapter(BaseApiAdapter):
 
         nr_ends = self.version_start(output)
 
-        output.write(self.as_str())
-
         need_brace = variable.accesscode != '' or variable.getcode != '' or variable.setcode != ''
 
         if need_brace:
-            output.write(' {\n', indent=False)
-
-        output.write_code_directive('%AccessCode', variable.accesscode)
-        output.write_code_directive('%GetCode', variable.getcode)
-        output.write_code_directive('%SetCode', variable.setcode)
+            output.write(self.as_str() + ' {\n')
 
-        if need_brace:
-            output.write('}')
+            output.write_code_directive('%AccessCode', variable.accesscode)
+            output.write_code_directive('%GetCode', variable.getcode)
+            output.write_code_directive('%SetCode', variable.setcode)
 
-        output.write(';\n', indent=False)
+            output.write('};\n')
+        else:
+            output.write(self.as_str() + ';\n')
 
         self.version_end(nr_ends, output)
 
@@ -102,17 +99,15 @@ class VariableAdapter(BaseApiAdapter):
         output.write('<Variable')
         adapt(variable, Code).save_attributes(output)
         adapt(variable, Access).save_attributes(output)
-        self.save_attribute('name', variable.name, output)
-        self.save_attribute('type', variable.type, output)
+        output.write(
+                f' name="{self._escape(variable.name)}" type="{self._escape(variable.type)}"')
         self.save_bool('static', output)
         output.write('>\n')
 
         output += 1
         adapt(variable, Code).save_subelements(output)
         adapt(variable, Access).save_subelements(output)
-        self.save_literal('accesscode', output)
-        self.save_literal('getcode', output)
-        self.save_literal('setcode', output)
+        self.save_literals(('accesscode', 'getcode', 'setcode'), output)
         output -= 1
 
         output.write('</Variable>\n')
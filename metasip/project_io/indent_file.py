@@ -8,14 +8,18 @@ from ..exceptions import UserException
 
 class IndentFile:
     """ This is a thin wrapper around a file object that supports indentation.
+    The data is accumulated in memory and written to the file when it is
+    closed.
     """
 
     def __init__(self, file_name, indent):
         """ Create a file for writing. """
 
         self._f = open(file_name, 'w', encoding='UTF-8')
+        self._parts = []
         self._indent = indent
         self._nr_indents = 0
+        self._prefix = ''
         self._indent_next = True
         self._blank = False
         self._suppress_blank = False
@@ -26,6 +30,7 @@ class IndentFile:
         """ Increase the indentation. """
 
         self._nr_indents += by
+        self._prefix = ' ' * (self._indent * self._nr_indents)
         self._suppress_blank = True
 
         return self
@@ -34,6 +39,7 @@ class IndentFile:
         """ Decrease the indentation. """
 
         self._nr_indents -= by
+        self._prefix = ' ' * (self._indent * self._nr_indents)
         self._blank = False
         self._suppress_blank = False
 
@@ -48,6 +54,7 @@ class IndentFile:
     def close(self):
         """ Close the file. """
 
+        self._f.write(''.join(self._parts))
         self._f.close()
 
     @classmethod
@@ -65,29 +72,38 @@ class IndentFile:
         """ Write data to the file with optional automatic indentation. """
 
         if data:
-            if self._blank:
-                self._f.write('\n')
-                self._blank = False
-
-            lines = data.split('\n')
-
-            for l in lines[:-1]:
-                if indent and self._indent_next:
-                    self._f.write(' ' * (self._indent * self._nr_indents))
-
-                self._f.write(l + '\n')
-                self._indent_next = True
-
-            # Handle the last line.
-            l = lines[-1]
+            if indent:
+                prefix = self._prefix
+                first_prefix = prefix if self._indent_next else ''
+            else:
+                prefix = first_prefix = ''
 
-            if l:
-                if indent and self._indent_next:
-                    self._f.write(' ' * (self._indent * self._nr_indents))
+            nl = data.find('\n')
 
-                self._f.write(l)
+            if nl < 0:
+                # The common case of a fragment of a line.
+                text = first_prefix + data
                 self._indent_next = False
-            else:
+            elif nl == len(data) - 1:
+                # The common case of a single complete line.
+                text = first_prefix + data
                 self._indent_next = True
+            else:
+                # Every line is indented (even if it is empty) apart from an
+                # empty last line, ie. when the data ends with a newline.
+                lines = data.split('\n')
+
+                if lines[-1]:
+                    text = first_prefix + ('\n' + prefix).join(lines)
+                    self._indent_next = False
+                else:
+                    del lines[-1]
+                    text = first_prefix + ('\n' + prefix).join(lines) + '\n'
+                    self._indent_next = True
+
+            if self._blank:
+                text = '\n' + text
+                self._blank = False
 
+            self._parts.append(text)
             self._suppress_blank = False
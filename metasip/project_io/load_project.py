@@ -10,9 +10,10 @@ from ..models import MinimumProjectVersion, ProjectVersion
 from ..models.adapters import adapt
 
 
-def load_project(project, ui=None):
+def load_project(project, ui=None, ignored_modules=None):
     """ Populate a project from its project file.  Return True if the user
-    didn't cancel.
+    didn't cancel.  The contents of any ignored modules are not loaded and so
+    the project should not then be saved.
     """
 
     # Load the file.
@@ -63,6 +64,14 @@ def load_project(project, ui=None):
 
         project.version = version
 
+    # Discard the contents of any ignored modules before any models are
+    # created for them.  The modules themselves are kept so that the caller
+    # can still see that they have been ignored.
+    if ignored_modules:
+        for module_element in root.iterfind('Module'):
+            if module_element.get('name') in ignored_modules:
+                del module_element[:]
+
     # Populate the project.
     adapt(project).load(root, project, ui)
 
@@ -3,6 +3,8 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
+import os
+
 from ..exceptions import UserException
 from ..models.adapters import adapt
 
@@ -13,8 +15,12 @@ def save_project(project, ui):
     """ Save a project to its project file.  Return True if there was no error.
     """
 
+    # Write to a temporary file and then replace the project file so that the
+    # existing file isn't lost if there is an error.
+    temp_name = project.name + '.new'
+
     try:
-        output = IndentFile.create(project.name, indent=2)
+        output = IndentFile.create(temp_name, indent=2)
     except UserException as e:
         ui.error_creating_file("Save", e.text, e.detail)
         return False
@@ -23,4 +29,11 @@ def save_project(project, ui):
 
     output.close()
 
+    try:
+        os.replace(temp_name, project.name)
+    except OSError as e:
+        ui.error_creating_file("Save",
+                f"There was an error replacing '{project.name}'", str(e))
+        return False
+
     return True